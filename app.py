@@ -1,119 +1,119 @@
-from flask import Flask, render_template, request, redirect, url_for, flash
-from flask_sqlalchemy import SQLAlchemy
-from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
-from werkzeug.security import generate_password_hash, check_password_hash
+from flask import Flask, Blueprint, current_app, render_template, request, redirect, url_for, flash, Response
+from flask_login import login_user, login_required, logout_user, current_user
+from collections import deque
 from datetime import datetime
+from models import (db, login_manager, Sale, Booking, ArchivedBooking, User, Animal, BookingAnimal,
+                    ArchivedBookingAnimal, BookingEvent, Ban, is_banned, booking_history, record_booking_event,
+                    prune_booking_events, rebuild_with_autoincrement)
 import json
 import os
-
-app = Flask(__name__,
-            template_folder=os.path.join(os.path.dirname(__file__), 'templates'),
-            static_folder=os.path.join(os.path.dirname(__file__), 'static'))
-app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-key-change-later')
-app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('SQLALCHEMY_DATABASE_URI', 'sqlite:///users.db')
-app.config['BASE_HOURLY_RATE'] = float(os.environ.get('BASE_HOURLY_RATE', '15.0'))
-app.config['FLASK_ENV'] = os.environ.get('FLASK_ENV', 'development')
-db = SQLAlchemy(app)
-login_manager = LoginManager(app)
-login_manager.login_view = 'login'
-
-class Sale(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(100), nullable=False)
-    is_active = db.Column(db.Boolean, default=False)
-    discount_percentage = db.Column(db.Float, nullable=False)
-    color = db.Column(db.String(50), default='#2ecc71')
-
-class Booking(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
-    booking_name = db.Column(db.String(100), nullable=False)
-    phone_number = db.Column(db.String(20), nullable=False)
-    date = db.Column(db.Date, nullable=False)
-    start_time = db.Column(db.Time, nullable=False)
-    duration_hours = db.Column(db.Float, nullable=False)
-    total_cost = db.Column(db.Float, nullable=False)
-    sale_applied = db.Column(db.Integer, db.ForeignKey('sale.id'), nullable=True)
-    status = db.Column(db.String(20), default='pending', nullable=False)  # pending, approved, denied, in_progress, completed
-    admin_notes = db.Column(db.Text, nullable=True)
-    user_notes = db.Column(db.Text, nullable=True)
-    num_dogs = db.Column(db.Integer, nullable=True)
-    dog_breed = db.Column(db.String(100), nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    
-    user = db.relationship('User', backref='bookings')
-    sale = db.relationship('Sale', backref='bookings')
-    selected_animals = db.relationship('BookingAnimal', backref='booking', lazy=True, cascade='all, delete-orphan')
-
-class User(UserMixin, db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    username = db.Column(db.String(80), unique=True, nullable=False)
-    email = db.Column(db.String(120), unique=True, nullable=False)
-    phone_number = db.Column(db.String(20), unique=False, nullable=True)
-    password_hash = db.Column(db.String(120), nullable=False)
-    is_admin = db.Column(db.Boolean, default=False)
-    animals = db.relationship('Animal', backref='owner', lazy=True, cascade='all, delete-orphan')
-
-    def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
-
-    def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
-
-class Animal(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
-    name = db.Column(db.String(100), nullable=False)
-    animal_type = db.Column(db.String(50), nullable=False)  # dog, cat, bird, rabbit, etc.
-    breed = db.Column(db.String(100), nullable=False)
-    age = db.Column(db.Integer, nullable=True)
-    weight = db.Column(db.Float, nullable=True)  # in pounds
-    special_needs = db.Column(db.Text, nullable=True)
-    temperament = db.Column(db.String(50), nullable=True)  # friendly, shy, energetic, etc.
-    medical_conditions = db.Column(db.Text, nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-    # Relationship to booking associations with cascade delete
-    booking_associations = db.relationship('BookingAnimal', backref='animal', lazy=True, cascade='all, delete-orphan')
-
-class BookingAnimal(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    booking_id = db.Column(db.Integer, db.ForeignKey('booking.id'), nullable=False)
-    animal_id = db.Column(db.Integer, db.ForeignKey('animal.id'), nullable=False)
-
-class Ban(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    email = db.Column(db.String(120), nullable=True)
-    phone_number = db.Column(db.String(20), nullable=True)
-    ip_address = db.Column(db.String(45), nullable=True)
-    reason = db.Column(db.String(255), nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-
-@login_manager.user_loader
-def load_user(user_id):
-    return db.session.get(User, int(user_id))
-
-# Helper to check if banned
-def is_banned(email=None, phone=None, ip=None):
-    ban_query = Ban.query
-    if email:
-        ban_query = ban_query.filter_by(email=email)
-    if phone:
-        ban_query = ban_query.filter_by(phone_number=phone)
-    if ip:
-        ban_query = ban_query.filter_by(ip_address=ip)
-    return ban_query.first() is not None
-
-@app.route('/')
+import queue
+import threading
+import time
+
+bp = Blueprint('main', __name__)
+
+class BookingFeed:
+    """Fans the booking change log out to connected admin streams.
+
+    One thread per process tails booking_event by id and pushes new rows to every
+    subscriber queue, so open admin pages cost one query per poll in total. Plain
+    threading/queue primitives keep it working under gevent's monkey patching.
+    """
+
+    def __init__(self, app, backlog=200):
+        self.app = app
+        self.recent = deque(maxlen=backlog)
+        self.subscribers = set()
+        self.lock = threading.Lock()
+        self.cursor = 0
+        self.thread = None
+        self.last_prune = float('-inf')
+
+    def subscribe(self, last_event_id=None):
+        subscription = queue.Queue()
+        with self.lock:
+            if self.thread is None:
+                self._load_recent()
+                self.thread = threading.Thread(target=self._run, name='booking-feed', daemon=True)
+                self.thread.start()
+            if last_event_id is not None:
+                oldest = self.recent[0]['event_id'] if self.recent else self.cursor + 1
+                if last_event_id < oldest - 1:
+                    # Missed more than the replay buffer holds; the page has to reload
+                    subscription.put({'event_id': self.cursor, 'kind': 'resync'})
+                else:
+                    for event in self.recent:
+                        if event['event_id'] > last_event_id:
+                            subscription.put(event)
+            self.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            self.subscribers.discard(subscription)
+
+    def _load_recent(self):
+        with self.app.app_context():
+            rows = BookingEvent.query.order_by(BookingEvent.id.desc()).limit(self.recent.maxlen).all()
+            self.recent.clear()
+            self.recent.extend(row.to_payload() for row in reversed(rows))
+            self.cursor = rows[0].id if rows else 0
+
+    def _run(self):
+        while True:
+            time.sleep(self.app.config['BOOKING_FEED_POLL_SECONDS'])
+            with self.lock:
+                if not self.subscribers:
+                    self.thread = None
+                    return
+            try:
+                self._poll()
+            except Exception as e:
+                self.app.logger.warning(f"Booking feed poll failed: {e}")
+
+    def _poll(self):
+        with self.app.app_context():
+            rows = (BookingEvent.query
+                    .filter(BookingEvent.id > self.cursor)
+                    .order_by(BookingEvent.id)
+                    .limit(500)
+                    .all())
+            events = [row.to_payload() for row in rows]
+            newest_id = None
+            if not events:
+                newest_id = db.session.query(db.func.max(BookingEvent.id)).scalar()
+            # init-db, archive_bookings.py and `flask prune-events` prune too, so
+            # retention holds even when no admin keeps the page open
+            if time.monotonic() - self.last_prune > 3600:
+                self.last_prune = time.monotonic()
+                prune_booking_events(self.app.config['BOOKING_EVENT_RETENTION_DAYS'])
+        if not events:
+            if newest_id is not None and newest_id < self.cursor:
+                # The log went backwards, e.g. backup_db.py restored an older copy;
+                # start over from there and tell open pages to reload
+                with self.lock:
+                    self.cursor = newest_id
+                    self.recent.clear()
+                    for subscription in self.subscribers:
+                        subscription.put({'event_id': newest_id, 'kind': 'resync'})
+            return
+        with self.lock:
+            self.cursor = events[-1]['event_id']
+            self.recent.extend(events)
+            for subscription in self.subscribers:
+                for event in events:
+                    subscription.put(event)
+
+@bp.route('/')
 def home():
     active_sale = Sale.query.filter_by(is_active=True).first()
-    return render_template('home.html', active_sale=active_sale, base_rate=app.config['BASE_HOURLY_RATE'])
+    return render_template('home.html', active_sale=active_sale, base_rate=current_app.config['BASE_HOURLY_RATE'])
 
-@app.route('/login', methods=['GET', 'POST'])
+@bp.route('/login', methods=['GET', 'POST'])
 def login():
     if current_user.is_authenticated:
-        return redirect(url_for('home'))
+        return redirect(url_for('main.home'))
     
     if request.method == 'POST':
         ip = request.remote_addr
@@ -122,32 +122,32 @@ def login():
         if user:
             if is_banned(email=user.email) or is_banned(phone=user.phone_number) or is_banned(ip=ip):
                 flash('You are banned from logging in. Contact support.')
-                return redirect(url_for('login'))
+                return redirect(url_for('main.login'))
             if user.check_password(request.form['password']):
                 login_user(user)
-                return redirect(url_for('home'))
+                return redirect(url_for('main.home'))
         flash('Invalid username or password')
     return render_template('login.html')
 
-@app.route('/register', methods=['GET', 'POST'])
+@bp.route('/register', methods=['GET', 'POST'])
 def register():
     if current_user.is_authenticated:
-        return redirect(url_for('home'))
+        return redirect(url_for('main.home'))
     if request.method == 'POST':
         ip = request.remote_addr
         email = request.form['email']
         phone = request.form.get('phone')
         if is_banned(email=email) or is_banned(phone=phone) or is_banned(ip=ip):
             flash('You are banned from registering. Contact support.')
-            return redirect(url_for('register'))
+            return redirect(url_for('main.register'))
         
         if User.query.filter_by(username=request.form['username']).first():
             flash('Username already exists')
-            return redirect(url_for('register'))
+            return redirect(url_for('main.register'))
         
         if User.query.filter_by(email=request.form['email']).first():
             flash('Email already registered')
-            return redirect(url_for('register'))
+            return redirect(url_for('main.register'))
         
         user = User(
             username=request.form['username'],
@@ -161,31 +161,31 @@ def register():
         db.session.add(user)
         db.session.commit()
         flash('Registration successful')
-        return redirect(url_for('login'))
+        return redirect(url_for('main.login'))
     return render_template('register.html')
 
-@app.route('/logout')
+@bp.route('/logout')
 @login_required
 def logout():
     logout_user()
-    return redirect(url_for('home'))
+    return redirect(url_for('main.home'))
 
-@app.route('/admin')
+@bp.route('/admin')
 @login_required
 def admin():
     if not current_user.is_admin:
         flash('Access denied')
-        return redirect(url_for('home'))
+        return redirect(url_for('main.home'))
     users = User.query.all()
     sales = Sale.query.all()
     return render_template('admin.html', users=users, sales=sales)
 
-@app.route('/admin/sale', methods=['POST'])
+@bp.route('/admin/sale', methods=['POST'])
 @login_required
 def manage_sale():
     if not current_user.is_admin:
         flash('Access denied')
-        return redirect(url_for('home'))
+        return redirect(url_for('main.home'))
     
     action = request.form.get('action')
     if action == 'create':
@@ -201,7 +201,7 @@ def manage_sale():
         sale = db.session.get(Sale, sale_id)
         if not sale:
             flash('Sale not found')
-            return redirect(url_for('admin'))
+            return redirect(url_for('main.admin'))
         sale.name = request.form['name']
         sale.discount_percentage = float(request.form['discount'])
         sale.is_active = bool(request.form.get('is_active'))
@@ -211,13 +211,13 @@ def manage_sale():
         sale = db.session.get(Sale, sale_id)
         if not sale:
             flash('Sale not found')
-            return redirect(url_for('admin'))
+            return redirect(url_for('main.admin'))
         db.session.delete(sale)
     
     db.session.commit()
-    return redirect(url_for('admin'))
+    return redirect(url_for('main.admin'))
 
-@app.route('/book', methods=['GET', 'POST'])
+@bp.route('/book', methods=['GET', 'POST'])
 @login_required
 def book_session():
     if request.method == 'POST':
@@ -231,7 +231,7 @@ def book_session():
         num_animals = len(selected_animal_ids)  # Auto-count selected animals
         
         # Calculate cost
-        base_cost = app.config['BASE_HOURLY_RATE'] * duration
+        base_cost = current_app.config['BASE_HOURLY_RATE'] * duration
         active_sale = Sale.query.filter_by(is_active=True).first()
         if active_sale:
             discount = base_cost * (active_sale.discount_percentage / 100)
@@ -264,33 +264,34 @@ def book_session():
                 booking_animal = BookingAnimal(booking_id=booking.id, animal_id=int(animal_id))
                 db.session.add(booking_animal)
         
+        record_booking_event(booking, 'created')
         db.session.commit()
         flash('Your booking request has been submitted and is pending approval.')
-        return redirect(url_for('my_bookings'))
+        return redirect(url_for('main.my_bookings'))
     active_sale = Sale.query.filter_by(is_active=True).first()
     today = datetime.now().strftime('%Y-%m-%d')
     
     # Get user's animals for selection
     user_animals = Animal.query.filter_by(user_id=current_user.id).order_by(Animal.name).all()
     
-    return render_template('book.html', base_rate=app.config['BASE_HOURLY_RATE'], active_sale=active_sale, today=today, user_animals=user_animals)
+    return render_template('book.html', base_rate=current_app.config['BASE_HOURLY_RATE'], active_sale=active_sale, today=today, user_animals=user_animals)
 
-@app.route('/my-bookings')
+@bp.route('/my-bookings')
 @login_required
 def my_bookings():
-    bookings = Booking.query.filter_by(user_id=current_user.id).order_by(Booking.date, Booking.start_time).all()
+    bookings = booking_history(user_id=current_user.id)
     # Load selected animals for each booking
     for booking in bookings:
         booking.selected_animals_list = [ba.animal for ba in booking.selected_animals]
     return render_template('my_bookings.html', bookings=bookings)
 
-@app.route('/my-animals')
+@bp.route('/my-animals')
 @login_required
 def my_animals():
     animals = Animal.query.filter_by(user_id=current_user.id).order_by(Animal.name).all()
     return render_template('my_animals.html', animals=animals)
 
-@app.route('/add-animal', methods=['GET', 'POST'])
+@bp.route('/add-animal', methods=['GET', 'POST'])
 @login_required
 def add_animal():
     if request.method == 'POST':
@@ -308,10 +309,10 @@ def add_animal():
         db.session.add(animal)
         db.session.commit()
         flash('Animal profile added successfully!')
-        return redirect(url_for('my_animals'))
+        return redirect(url_for('main.my_animals'))
     return render_template('add_animal.html')
 
-@app.route('/edit-animal/<int:animal_id>', methods=['GET', 'POST'])
+@bp.route('/edit-animal/<int:animal_id>', methods=['GET', 'POST'])
 @login_required
 def edit_animal(animal_id):
     animal = Animal.query.filter_by(id=animal_id, user_id=current_user.id).first_or_404()
@@ -326,25 +327,25 @@ def edit_animal(animal_id):
         animal.medical_conditions = request.form.get('medical_conditions')
         db.session.commit()
         flash('Animal profile updated successfully!')
-        return redirect(url_for('my_animals'))
+        return redirect(url_for('main.my_animals'))
     return render_template('edit_animal.html', animal=animal)
 
-@app.route('/delete-animal/<int:animal_id>', methods=['POST'])
+@bp.route('/delete-animal/<int:animal_id>', methods=['POST'])
 @login_required
 def delete_animal(animal_id):
     animal = Animal.query.filter_by(id=animal_id, user_id=current_user.id).first_or_404()
     db.session.delete(animal)
     db.session.commit()
     flash('Animal profile deleted successfully!')
-    return redirect(url_for('my_animals'))
+    return redirect(url_for('main.my_animals'))
 
-@app.route('/view-animal/<int:animal_id>')
+@bp.route('/view-animal/<int:animal_id>')
 @login_required
 def view_animal(animal_id):
     animal = Animal.query.filter_by(id=animal_id, user_id=current_user.id).first_or_404()
     return render_template('view_animal.html', animal=animal)
 
-@app.route('/delete-booking/<int:booking_id>', methods=['POST'])
+@bp.route('/delete-booking/<int:booking_id>', methods=['POST'])
 @login_required
 def delete_booking(booking_id):
     booking = Booking.query.filter_by(id=booking_id).first_or_404()
@@ -352,81 +353,90 @@ def delete_booking(booking_id):
     # Check if user is admin or owns the booking
     if not current_user.is_admin and booking.user_id != current_user.id:
         flash('Access denied')
-        return redirect(url_for('home'))
+        return redirect(url_for('main.home'))
     
     # Don't allow deletion of completed bookings
     if booking.status == 'completed':
         flash('Cannot delete completed bookings')
-        return redirect(url_for('my_bookings') if booking.user_id == current_user.id else url_for('admin_bookings'))
+        return redirect(url_for('main.my_bookings') if booking.user_id == current_user.id else url_for('main.admin_bookings'))
     
+    record_booking_event(booking, 'deleted')
     db.session.delete(booking)
     db.session.commit()
     
     if current_user.is_admin:
         flash('Booking deleted successfully!')
-        return redirect(url_for('admin_bookings'))
+        return redirect(url_for('main.admin_bookings'))
     else:
         flash('Your booking has been cancelled successfully!')
-        return redirect(url_for('my_bookings'))
+        return redirect(url_for('main.my_bookings'))
 
-@app.route('/admin/delete/<int:user_id>')
+@bp.route('/admin/delete/<int:user_id>')
 @login_required
 def delete_user(user_id):
     if not current_user.is_admin:
         flash('Access denied')
-        return redirect(url_for('home'))
+        return redirect(url_for('main.home'))
     user = db.session.get(User, user_id)
     if not user:
         flash('User not found')
-        return redirect(url_for('admin'))
+        return redirect(url_for('main.admin'))
     if user.id == current_user.id:
         flash('Cannot delete your own account')
-        return redirect(url_for('admin'))
+        return redirect(url_for('main.admin'))
     # Delete all bookings for this user first
+    for booking in Booking.query.filter_by(user_id=user.id).all():
+        record_booking_event(booking, 'deleted')
     Booking.query.filter_by(user_id=user.id).delete()
+    # ...and their archived history
+    archived_ids = db.session.query(ArchivedBooking.id).filter_by(user_id=user.id)
+    ArchivedBookingAnimal.query.filter(ArchivedBookingAnimal.booking_id.in_(archived_ids)).delete(synchronize_session=False)
+    ArchivedBooking.query.filter_by(user_id=user.id).delete()
     db.session.delete(user)
     db.session.commit()
     flash('User and their bookings deleted')
-    return redirect(url_for('admin'))
+    return redirect(url_for('main.admin'))
 
-@app.route('/admin/toggle-admin/<int:user_id>')
+@bp.route('/admin/toggle-admin/<int:user_id>')
 @login_required
 def toggle_admin(user_id):
     if not current_user.is_admin:
         flash('Access denied')
-        return redirect(url_for('home'))
+        return redirect(url_for('main.home'))
     
     user = db.session.get(User, user_id)
     if not user:
         flash('User not found')
-        return redirect(url_for('admin'))
+        return redirect(url_for('main.admin'))
     if user.id == current_user.id:
         flash('Cannot modify your own admin status')
-        return redirect(url_for('admin'))
+        return redirect(url_for('main.admin'))
     
     user.is_admin = not user.is_admin
     db.session.commit()
     flash(f'Admin status updated for {user.username}')
-    return redirect(url_for('admin'))
+    return redirect(url_for('main.admin'))
 
-@app.route('/admin/booking/<int:booking_id>', methods=['POST'])
+@bp.route('/admin/booking/<int:booking_id>', methods=['POST'])
 @login_required
 def update_booking(booking_id):
     if not current_user.is_admin:
         flash('Access denied')
-        return redirect(url_for('home'))
+        return redirect(url_for('main.home'))
 
     booking = db.session.get(Booking, booking_id)
     if not booking:
         flash('Booking not found')
-        return redirect(url_for('admin_bookings'))
+        return redirect(url_for('main.admin_bookings'))
 
     action = request.form.get('action')
 
     if action == 'status':
         new_status = request.form.get('status')
         if new_status:
-            booking.status = new_status
+            if new_status != booking.status:
+                booking.status = new_status
+                record_booking_event(booking, 'status')
             flash(f'Booking #{booking.id} status updated to {new_status}.')
     elif action == 'notes':
         new_notes = request.form.get('notes')
@@ -434,77 +444,69 @@ def update_booking(booking_id):
         flash(f'Admin notes for booking #{booking.id} updated.')
     
     db.session.commit()
-    return redirect(url_for('admin_bookings'))
-@app.route('/admin/bookings')
+    return redirect(url_for('main.admin_bookings'))
+@bp.route('/admin/bookings')
 @login_required
 def admin_bookings():
     if not current_user.is_admin:
         flash('Access denied')
-        return redirect(url_for('home'))
-    bookings = Booking.query.order_by(Booking.date, Booking.start_time).all()
+        return redirect(url_for('main.home'))
+    # Archived history is opt-in so the default view only reads the hot table
+    include_archived = request.args.get('archived') == '1'
+    bookings = booking_history(include_archived=include_archived)
     # Load selected animals for each booking
     for booking in bookings:
         booking.selected_animals_list = [ba.animal for ba in booking.selected_animals]
-    return render_template('admin_bookings.html', bookings=bookings)
+    return render_template('admin_bookings.html', bookings=bookings, include_archived=include_archived)
 
-@app.route('/legal')
+@bp.route('/admin/bookings/stream')
+@login_required
+def admin_bookings_stream():
+    """Server-Sent Events stream of booking changes for the admin bookings page"""
+    if not current_user.is_admin:
+        return 'Access denied', 403
+    last_event_id = request.headers.get('Last-Event-ID', type=int)
+    booking_feed = current_app.extensions['booking_feed']
+    # Streams end after a while so each connection's queue and greenlet are
+    # released and clients reconnect periodically; EventSource does that on its
+    # own and resumes from Last-Event-ID.
+    deadline = time.monotonic() + current_app.config['BOOKING_FEED_STREAM_SECONDS']
+
+    def stream():
+        subscription = booking_feed.subscribe(last_event_id)
+        try:
+            yield 'retry: 3000\n\n'
+            while time.monotonic() < deadline:
+                try:
+                    event = subscription.get(timeout=max(0.0, min(15.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    yield ': keep-alive\n\n'
+                    continue
+                yield f"id: {event['event_id']}\ndata: {json.dumps(event)}\n\n"
+        finally:
+            booking_feed.unsubscribe(subscription)
+
+    return Response(stream(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@bp.route('/legal')
 def legal():
     return render_template('legal.html')
 
-@app.route('/pet-requirements')
+@bp.route('/pet-requirements')
 def pet_requirements():
     return render_template('pet_requirements.html')
 
-# Admin user management from JSON
-ADMIN_JSON_PATH = os.path.join(os.path.dirname(__file__), 'admin_user.json')
-def load_admin_user():
-    if not os.path.exists(ADMIN_JSON_PATH):
-        return None
-    with open(ADMIN_JSON_PATH, 'r') as f:
-        return json.load(f)
-
-def ensure_admin_user():
-    admin_data = load_admin_user()
-    if not admin_data or not admin_data.get('enabled', True):
-        return
-    user = User.query.filter_by(username=admin_data['username']).first()
-    if not user:
-        user = User(
-            username=admin_data['username'],
-            email=admin_data['email'],
-            is_admin=True
-        )
-        user.set_password(admin_data['password'])
-        db.session.add(user)
-        db.session.commit()
-    else:
-        user.is_admin = True
-        db.session.commit()
-
-with app.app_context():
-    # Only create tables if they don't exist (for development)
-    try:
-        db.create_all()
-        ensure_admin_user()
-    except Exception as e:
-        # Tables might already exist, skip creation
-        print(f"Database tables already exist or error occurred: {e}")
-        # Still ensure admin user exists
-        try:
-            ensure_admin_user()
-        except Exception as admin_error:
-            print(f"Admin user setup error: {admin_error}")
-
-@app.route('/admin/toggle-admin-user', methods=['POST'])
+@bp.route('/admin/toggle-admin-user', methods=['POST'])
 @login_required
 def toggle_admin_user():
     if not current_user.is_admin:
         flash('Access denied')
-        return redirect(url_for('admin'))
+        return redirect(url_for('main.admin'))
     admin_data = load_admin_user()
     if not admin_data:
         flash('No admin user config found.')
-        return redirect(url_for('admin'))
+        return redirect(url_for('main.admin'))
     admin_data['enabled'] = not admin_data.get('enabled', True)
     with open(ADMIN_JSON_PATH, 'w') as f:
         json.dump(admin_data, f, indent=2)
@@ -514,31 +516,103 @@ def toggle_admin_user():
     if user:
         user.is_admin = admin_data['enabled']
         db.session.commit()
-    return redirect(url_for('admin'))
+    return redirect(url_for('main.admin'))
 
-@app.route('/admin/ban/<int:user_id>', methods=['POST'])
+@bp.route('/admin/ban/<int:user_id>', methods=['POST'])
 @login_required
 def ban_user(user_id):
     if not current_user.is_admin:
         flash('Access denied')
-        return redirect(url_for('admin'))
+        return redirect(url_for('main.admin'))
     user = db.session.get(User, user_id)
     if not user:
         flash('User not found')
-        return redirect(url_for('admin'))
+        return redirect(url_for('main.admin'))
     # Ban by email, phone, and IP
     ban = Ban(email=user.email, phone_number=user.phone_number)
     db.session.add(ban)
     db.session.commit()
     flash('User banned. All future users with same email, phone, or IP will be banned.')
-    return redirect(url_for('admin'))
+    return redirect(url_for('main.admin'))
 
-@app.route('/health')
+@bp.route('/health')
 def health_check():
     """Health check endpoint for deployment monitoring"""
     return {'status': 'healthy', 'timestamp': datetime.utcnow().isoformat()}
 
+# Admin user management from JSON
+ADMIN_JSON_PATH = os.path.join(os.path.dirname(__file__), 'admin_user.json')
+def load_admin_user():
+    if not os.path.exists(ADMIN_JSON_PATH):
+        return None
+    with open(ADMIN_JSON_PATH, 'r') as f:
+        return json.load(f)
+
+def ensure_admin_user():
+    admin_data = load_admin_user()
+    if not admin_data or not admin_data.get('enabled', True):
+        return
+    user = User.query.filter_by(username=admin_data['username']).first()
+    if not user:
+        user = User(
+            username=admin_data['username'],
+            email=admin_data['email'],
+            is_admin=True
+        )
+        user.set_password(admin_data['password'])
+        db.session.add(user)
+        db.session.commit()
+    else:
+        user.is_admin = True
+        db.session.commit()
+
+def bootstrap_database():
+    """Create missing tables, upgrade id columns and sync the admin user from admin_user.json"""
+    db.create_all()
+    # Tables created before AUTOINCREMENT was declared would reuse ids; archived
+    # bookings keep theirs, so new booking ids must start above the archive too.
+    rebuild_with_autoincrement(BookingEvent)
+    newest_archived_id = db.session.query(db.func.max(ArchivedBooking.id)).scalar() or 0
+    rebuild_with_autoincrement(Booking, min_next_id=newest_archived_id)
+    db.session.commit()
+    prune_booking_events(current_app.config['BOOKING_EVENT_RETENTION_DAYS'])
+    ensure_admin_user()
+
+def create_app():
+    """Build the Flask app. Does no database I/O; run `flask --app app init-db` to bootstrap."""
+    app = Flask(__name__,
+                template_folder=os.path.join(os.path.dirname(__file__), 'templates'),
+                static_folder=os.path.join(os.path.dirname(__file__), 'static'))
+    app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-key-change-later')
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('SQLALCHEMY_DATABASE_URI', 'sqlite:///users.db')
+    app.config['BASE_HOURLY_RATE'] = float(os.environ.get('BASE_HOURLY_RATE', '15.0'))
+    app.config['FLASK_ENV'] = os.environ.get('FLASK_ENV', 'development')
+    # Live admin booking feed (Server-Sent Events)
+    app.config['BOOKING_FEED_POLL_SECONDS'] = float(os.environ.get('BOOKING_FEED_POLL_SECONDS', '2.0'))
+    app.config['BOOKING_FEED_STREAM_SECONDS'] = float(os.environ.get('BOOKING_FEED_STREAM_SECONDS', '300'))
+    app.config['BOOKING_EVENT_RETENTION_DAYS'] = int(os.environ.get('BOOKING_EVENT_RETENTION_DAYS', '7'))
+
+    db.init_app(app)
+    login_manager.init_app(app)
+    app.extensions['booking_feed'] = BookingFeed(app)
+    app.register_blueprint(bp)
+
+    @app.cli.command('init-db')
+    def init_db_command():
+        """Create database tables and the admin user from admin_user.json."""
+        bootstrap_database()
+        print('Database initialized!')
+
+    @app.cli.command('prune-events')
+    def prune_events_command():
+        """Delete booking change log entries older than BOOKING_EVENT_RETENTION_DAYS."""
+        pruned = prune_booking_events(app.config['BOOKING_EVENT_RETENTION_DAYS'])
+        print(f'Pruned {pruned} booking events.')
+
+    return app
+
 if __name__ == '__main__':
+    app = create_app()
     with app.app_context():
-        ensure_admin_user()
-    app.run(debug=True)
\ No newline at end of file
+        bootstrap_database()
+    app.run(debug=True)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Booking archival script.
+Moves old completed/denied bookings and their animal selections out of the
+hot booking table into archived_booking / archived_booking_animal, in batches.
+Run with: python archive_bookings.py [--days 90] [--batch-size 500] [--pause 0.1]
+"""
+
+import argparse
+import time
+from datetime import date, datetime, timedelta
+from sqlalchemy import insert, literal, select
+from app import create_app
+from models import (db, Booking, BookingAnimal, ArchivedBooking, ArchivedBookingAnimal, BookingEvent,
+                    has_autoincrement, prune_booking_events)
+
+app = create_app()
+
+ARCHIVE_STATUSES = ('completed', 'denied')
+
+def archive_bookings(older_than_days=90, batch_size=500, pause=0.1):
+    """Archive terminal bookings dated more than older_than_days ago, one batch per transaction"""
+    cutoff = date.today() - timedelta(days=older_than_days)
+    booking_columns = [column.name for column in Booking.__table__.columns]
+    archived = 0
+
+    with app.app_context():
+        # Archived bookings keep their ids, which is only safe once booking never reuses them
+        if not has_autoincrement(Booking):
+            raise RuntimeError("booking table lacks AUTOINCREMENT; run `flask --app app init-db` first")
+
+        while True:
+            batch = (db.session.query(Booking.id)
+                     .filter(Booking.status.in_(ARCHIVE_STATUSES),
+                             Booking.date < cutoff)
+                     .order_by(Booking.id)
+                     .limit(batch_size)
+                     .all())
+            if not batch:
+                break
+            ids = [booking_id for booking_id, in batch]
+            # Re-check the filter in every statement: a booking can change status or be
+            # deleted between the select above and the first write, which takes the lock.
+            archivable = (Booking.id.in_(ids), Booking.status.in_(ARCHIVE_STATUSES), Booking.date < cutoff)
+
+            try:
+                db.session.execute(insert(ArchivedBooking).from_select(
+                    booking_columns + ['archived_at'],
+                    select(*[Booking.__table__.c[name] for name in booking_columns],
+                           literal(datetime.utcnow())).where(*archivable)))
+                moved = db.session.query(ArchivedBooking.id, ArchivedBooking.status).filter(ArchivedBooking.id.in_(ids)).all()
+                archivable_ids = select(Booking.id).where(*archivable)
+                db.session.execute(insert(ArchivedBookingAnimal).from_select(
+                    ['booking_id', 'animal_id'],
+                    select(BookingAnimal.booking_id, BookingAnimal.animal_id).where(BookingAnimal.booking_id.in_(archivable_ids))))
+                BookingAnimal.query.filter(BookingAnimal.booking_id.in_(archivable_ids)).delete(synchronize_session=False)
+                Booking.query.filter(*archivable).delete(synchronize_session=False)
+                for booking_id, status in moved:
+                    db.session.add(BookingEvent(booking_id=booking_id, kind='archived', status=status))
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+
+            archived += len(moved)
+            print(f"Archived {archived} bookings so far...")
+            # Give live requests a chance at the write lock between batches
+            time.sleep(pause)
+
+        # Scheduled archival also keeps the feed's change log within its retention window
+        prune_booking_events(app.config['BOOKING_EVENT_RETENTION_DAYS'])
+
+    return archived
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Archive old completed/denied bookings")
+    parser.add_argument('--days', type=int, default=90, help="archive bookings dated more than this many days ago")
+    parser.add_argument('--batch-size', type=int, default=500, help="bookings moved per transaction")
+    parser.add_argument('--pause', type=float, default=0.1, help="seconds to sleep between batches")
+    args = parser.parse_args()
+
+    try:
+        total = archive_bookings(args.days, args.batch_size, args.pause)
+        print(f"✅ Archived {total} bookings.")
+    except Exception as e:
+        print(f"❌ Archival failed: {e}")
+        raise SystemExit(1)
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Online SQLite backup script.
+Copies a WAL-mode snapshot of the live database with SQLite's online backup
+API in small page steps, pausing between steps to throttle I/O while gunicorn
+workers keep writing, then verifies and rotates the copies.
+
+Usage:
+  python backup_db.py backup [--keep 7]                 # One verified backup
+  python backup_db.py schedule [--interval-hours 24]    # Back up and rotate forever
+  python backup_db.py restore <backup file>             # Verified restore
+"""
+
+import argparse
+import glob
+import os
+import sqlite3
+import time
+from datetime import datetime
+from app import create_app
+from models import db
+
+app = create_app()
+
+def database_path():
+    """Absolute path of the app's SQLite database file"""
+    with app.app_context():
+        if db.engine.url.get_backend_name() != 'sqlite':
+            raise RuntimeError("backup_db.py only supports SQLite databases")
+        return os.path.abspath(db.engine.url.database)
+
+def default_backup_dir():
+    return os.environ.get('BACKUP_DIR', os.path.join(os.path.dirname(database_path()), 'backups'))
+
+def verify_database(path):
+    """Raise if the SQLite file at path fails PRAGMA integrity_check"""
+    conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    try:
+        result = conn.execute('PRAGMA integrity_check').fetchone()[0]
+    finally:
+        conn.close()
+    if result != 'ok':
+        raise RuntimeError(f"Integrity check failed for {path}: {result}")
+
+class BackupRestarted(Exception):
+    pass
+
+def copy_database(source_path, target_path, pages=64, pause=0.05, max_restarts=3, stats=None):
+    """Copy source into target with the online backup API, pages at a time.
+
+    In WAL mode (the app enables it on connect) the copy runs inside one read
+    transaction, so it reads a fixed snapshot while writers carry on, and the
+    pause between steps throttles the I/O. A rollback-journal source restarts
+    the copy whenever another connection writes; after max_restarts it falls
+    back to a single-step copy, which blocks writers until it finishes.
+    """
+    # sqlite3.connect would quietly create an empty source and back that up
+    if not os.path.exists(source_path):
+        raise RuntimeError(f"Database {source_path} does not exist")
+    stats = stats if stats is not None else {}
+    stats.update(steps=0, restarts=0, fell_back=False)
+    source = sqlite3.connect(source_path, timeout=30, isolation_level=None)
+    target = sqlite3.connect(target_path)
+    progress = {'remaining': None}
+    try:
+        if source.execute('PRAGMA journal_mode').fetchone()[0] == 'wal':
+            source.execute('BEGIN')
+            source.execute('SELECT 1 FROM sqlite_master LIMIT 1').fetchall()
+
+        def throttle(status, remaining, total):
+            stats['steps'] += 1
+            if progress['remaining'] is not None and remaining > progress['remaining']:
+                stats['restarts'] += 1
+                if stats['restarts'] > max_restarts:
+                    raise BackupRestarted()
+            progress['remaining'] = remaining
+            if remaining:
+                time.sleep(pause)
+        try:
+            source.backup(target, pages=pages, progress=throttle)
+        except BackupRestarted:
+            stats['fell_back'] = True
+            source.backup(target, pages=-1)
+    finally:
+        target.close()
+        source.close()
+    return stats
+
+def rotate_backups(backup_dir, stem, keep):
+    """Delete all but the newest `keep` backups of stem"""
+    backups = sorted(glob.glob(os.path.join(backup_dir, f'{stem}-*.db')))
+    for old_backup in backups[:-keep] if keep > 0 else []:
+        os.remove(old_backup)
+        print(f"🗑️  Removed old backup {old_backup}")
+
+def create_backup(backup_dir=None, keep=7, pages=64, pause=0.05, stats=None):
+    """Write a verified backup of the live database and rotate old ones"""
+    source_path = database_path()
+    backup_dir = backup_dir or default_backup_dir()
+    os.makedirs(backup_dir, exist_ok=True)
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    backup_path = os.path.join(backup_dir, f"{stem}-{datetime.utcnow().strftime('%Y%m%d-%H%M%S-%f')}.db")
+    if os.path.exists(backup_path):
+        raise RuntimeError(f"Backup {backup_path} already exists")
+
+    # Write under a temporary name so a half-written file is never mistaken for a backup
+    partial_path = backup_path + '.partial'
+    try:
+        stats = copy_database(source_path, partial_path, pages, pause, stats=stats)
+        # The copy inherits WAL mode; switch it back so each backup is one self-contained file
+        conn = sqlite3.connect(partial_path)
+        try:
+            conn.execute('PRAGMA journal_mode=DELETE')
+        finally:
+            conn.close()
+        verify_database(partial_path)
+        if os.path.exists(backup_path):
+            raise RuntimeError(f"Backup {backup_path} already exists")
+        os.replace(partial_path, backup_path)
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+
+    print(f"✅ Backup written to {backup_path} ({stats['steps']} steps, {stats['restarts']} restarts"
+          f"{', fell back to a single-step copy' if stats['fell_back'] else ''})")
+    rotate_backups(backup_dir, stem, keep)
+    return backup_path
+
+def restore_backup(backup_path, pages=64, pause=0.05):
+    """Verify a backup, keep a safety copy of the live database, then restore over it"""
+    verify_database(backup_path)
+    target_path = database_path()
+    safety_path = target_path + f".before-restore-{datetime.utcnow().strftime('%Y%m%d-%H%M%S-%f')}"
+    if os.path.exists(target_path):
+        copy_database(target_path, safety_path, pages, pause)
+        print(f"💾 Current database saved to {safety_path}")
+
+    # Restoring through the backup API takes SQLite's locks, so running workers
+    # see either the old or the restored database, never a torn file.
+    copy_database(backup_path, target_path, pages=-1, pause=0)
+    verify_database(target_path)
+    print(f"✅ Restored {backup_path} into {target_path}")
+    # booking_event ids roll back with the restore. Running workers notice on their next
+    # feed poll and send open admin pages a resync, but that only works while no new
+    # events have been written past the old cursor yet, so restart the app right away.
+    print("↻ Restart the app so the live booking feed starts from the restored events")
+
+def run_schedule(interval_hours, **backup_options):
+    while True:
+        try:
+            create_backup(**backup_options)
+        except Exception as e:
+            print(f"❌ Backup failed: {e}")
+        time.sleep(interval_hours * 3600)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Online backups for the SQLite database")
+    parser.add_argument('--pages', type=int, default=64, help="pages copied per backup step")
+    parser.add_argument('--pause', type=float, default=0.05, help="seconds to sleep between backup steps")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    backup_parser = commands.add_parser('backup', help="write one verified backup")
+    backup_parser.add_argument('--dir', help="backup directory (default: $BACKUP_DIR or backups/ next to the database)")
+    backup_parser.add_argument('--keep', type=int, default=7, help="number of backups to keep")
+
+    schedule_parser = commands.add_parser('schedule', help="back up and rotate on an interval")
+    schedule_parser.add_argument('--dir', help="backup directory (default: $BACKUP_DIR or backups/ next to the database)")
+    schedule_parser.add_argument('--keep', type=int, default=7, help="number of backups to keep")
+    schedule_parser.add_argument('--interval-hours', type=float, default=24, help="hours between backups")
+
+    restore_parser = commands.add_parser('restore', help="verify a backup and restore it over the live database")
+    restore_parser.add_argument('backup_file')
+
+    args = parser.parse_args()
+    try:
+        if args.command == 'backup':
+            create_backup(args.dir, args.keep, args.pages, args.pause)
+        elif args.command == 'schedule':
+            run_schedule(args.interval_hours, backup_dir=args.dir, keep=args.keep, pages=args.pages, pause=args.pause)
+        elif args.command == 'restore':
+            restore_backup(args.backup_file, args.pages, args.pause)
+    except Exception as e:
+        print(f"❌ {e}")
+        raise SystemExit(1)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Import-time budget check for worker boot.
+Imports the gunicorn entry point (wsgi) in a fresh interpreter with
+`python -X importtime`, fails if it takes longer than the budget or touches
+the database, and lists the slowest imports.
+Run with: python check_import_time.py [--budget-ms 1000] [--runs 3]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def measure_import(module, db_path):
+    """Return [(self_us, cumulative_us, name)] for one fresh import of module"""
+    env = dict(os.environ, SQLALCHEMY_DATABASE_URI=f'sqlite:///{db_path}')
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=PROJECT_DIR, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr}")
+
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        if self_us.strip().isdigit():
+            timings.append((int(self_us), int(cumulative_us), name.strip()))
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail if importing the app is slow or has side effects")
+    parser.add_argument('--module', default='wsgi', help="module gunicorn workers import")
+    parser.add_argument('--budget-ms', type=float, default=float(os.environ.get('IMPORT_BUDGET_MS', '1000')),
+                        help="maximum cumulative import time (default: $IMPORT_BUDGET_MS or 1000)")
+    parser.add_argument('--runs', type=int, default=3, help="imports to time; the fastest is compared to the budget")
+    parser.add_argument('--top', type=int, default=10, help="slowest imports to list")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, 'import-check.db')
+        runs = [measure_import(args.module, db_path) for _ in range(args.runs)]
+        touched_db = os.path.exists(db_path)
+
+    fastest = min(runs, key=lambda timings: next(c for _, c, name in timings if name == args.module))
+    total_ms = next(c for _, c, name in fastest if name == args.module) / 1000
+
+    print(f"Slowest imports of {args.module} (self time):")
+    for self_us, cumulative_us, name in sorted(fastest, reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:8.1f}ms  {name}")
+    print(f"import {args.module}: {total_ms:.1f}ms (budget {args.budget_ms:.0f}ms, fastest of {args.runs})")
+
+    failed = False
+    if touched_db:
+        print(f"❌ import {args.module} created or opened the database; move that work to `flask --app app init-db`")
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f"❌ import {args.module} is over budget by {total_ms - args.budget_ms:.1f}ms")
+        failed = True
+    if failed:
+        raise SystemExit(1)
+    print("✅ Import time within budget")
+
+if __name__ == "__main__":
+    main()
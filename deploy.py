@@ -6,12 +6,14 @@ Run with: python deploy.py
 
 import os
 import sys
-from app import app, db
+from app import create_app, bootstrap_database
+
+app = create_app()
 
 def create_database():
-    """Create database tables"""
+    """Create database tables and the admin user"""
     with app.app_context():
-        db.create_all()
+        bootstrap_database()
         print("✅ Database tables created successfully!")
 
 def run_development():
@@ -22,7 +24,7 @@ def run_development():
 def run_production():
     """Run in production mode with gunicorn"""
     print("🚀 Starting production server with gunicorn...")
-    os.system("gunicorn --bind 0.0.0.0:5000 --workers 3 app:app")
+    os.system("gunicorn --bind 0.0.0.0:5000 --workers 3 --worker-class gevent wsgi:app")
 
 if __name__ == "__main__":
     if len(sys.argv) > 1:
@@ -43,4 +45,4 @@ if __name__ == "__main__":
         print("  python deploy.py dev       # Run development server")
         print("  python deploy.py prod      # Run production server")
         print("\nFor production deployment, use:")
-        print("  gunicorn --bind 0.0.0.0:5000 --workers 3 app:app")
\ No newline at end of file
+        print("  gunicorn --bind 0.0.0.0:5000 --workers 3 --worker-class gevent wsgi:app")
\ No newline at end of file
@@ -3,22 +3,19 @@
 Docker database initialization script
 """
 
-from app import app, db
+from app import create_app, bootstrap_database
+
+app = create_app()
 
 def init_db():
     """Initialize the database"""
     with app.app_context():
-        print("Creating database tables...")
-        db.create_all()
-        print("✅ Database tables created successfully!")
-
-        # Ensure admin user exists
+        print("Creating database tables and admin user...")
         try:
-            from app import ensure_admin_user
-            ensure_admin_user()
-            print("✅ Admin user setup complete!")
+            bootstrap_database()
+            print("✅ Database tables and admin user set up successfully!")
         except Exception as e:
-            print(f"⚠️  Admin user setup issue: {e}")
+            print(f"⚠️  Database setup issue: {e}")
 
 if __name__ == "__main__":
     init_db()
\ No newline at end of file
@@ -1,5 +1,6 @@
-from app import app, db
+from app import create_app, bootstrap_database
 
+app = create_app()
 with app.app_context():
-    db.create_all()
+    bootstrap_database()
     print('Database initialized!')
@@ -4,9 +4,12 @@ Database migration script for adding dog profiles feature.
 Run this script to update your database schema.
 """
 
-from app import app, db
+from app import create_app
+from models import db, Booking, BookingEvent, ArchivedBooking, rebuild_with_autoincrement
 from sqlalchemy import text
 
+app = create_app()
+
 def migrate_database():
     """Add new tables and columns for dog profiles feature"""
 
@@ -42,10 +45,65 @@ def migrate_database():
                 )
             """))
 
+            # Create BookingEvent change log for the live admin feed
+            db.session.execute(text("""
+                CREATE TABLE IF NOT EXISTS booking_event (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    booking_id INTEGER NOT NULL,
+                    kind VARCHAR(20) NOT NULL,
+                    status VARCHAR(20),
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            """))
+
+            # Create archive tables for completed/denied bookings (archive_bookings.py)
+            db.session.execute(text("""
+                CREATE TABLE IF NOT EXISTS archived_booking (
+                    id INTEGER PRIMARY KEY,
+                    user_id INTEGER NOT NULL,
+                    booking_name VARCHAR(100) NOT NULL,
+                    phone_number VARCHAR(20) NOT NULL,
+                    date DATE NOT NULL,
+                    start_time TIME NOT NULL,
+                    duration_hours FLOAT NOT NULL,
+                    total_cost FLOAT NOT NULL,
+                    sale_applied INTEGER,
+                    status VARCHAR(20) NOT NULL,
+                    admin_notes TEXT,
+                    user_notes TEXT,
+                    num_dogs INTEGER,
+                    dog_breed VARCHAR(100),
+                    created_at DATETIME,
+                    archived_at DATETIME,
+                    FOREIGN KEY (user_id) REFERENCES user (id),
+                    FOREIGN KEY (sale_applied) REFERENCES sale (id)
+                )
+            """))
+            db.session.execute(text("""
+                CREATE TABLE IF NOT EXISTS archived_booking_animal (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    booking_id INTEGER NOT NULL,
+                    animal_id INTEGER NOT NULL,
+                    FOREIGN KEY (booking_id) REFERENCES archived_booking (id),
+                    FOREIGN KEY (animal_id) REFERENCES animal (id)
+                )
+            """))
+
             # Add indexes for better performance
             db.session.execute(text("CREATE INDEX IF NOT EXISTS idx_animal_user_id ON animal(user_id)"))
             db.session.execute(text("CREATE INDEX IF NOT EXISTS idx_booking_animal_booking_id ON booking_animal(booking_id)"))
             db.session.execute(text("CREATE INDEX IF NOT EXISTS idx_booking_animal_animal_id ON booking_animal(animal_id)"))
+            db.session.execute(text("CREATE INDEX IF NOT EXISTS ix_booking_event_created_at ON booking_event(created_at)"))
+            db.session.execute(text("CREATE INDEX IF NOT EXISTS ix_archived_booking_user_id ON archived_booking(user_id)"))
+            db.session.execute(text("CREATE INDEX IF NOT EXISTS ix_archived_booking_animal_booking_id ON archived_booking_animal(booking_id)"))
+
+            # Tables created by db.create_all() before AUTOINCREMENT was declared reuse ids
+            if rebuild_with_autoincrement(BookingEvent):
+                print("- Rebuilt booking_event with AUTOINCREMENT")
+            # New booking ids must also stay clear of ids already moved to archived_booking
+            newest_archived_id = db.session.query(db.func.max(ArchivedBooking.id)).scalar() or 0
+            if rebuild_with_autoincrement(Booking, min_next_id=newest_archived_id):
+                print("- Rebuilt booking with AUTOINCREMENT")
 
             db.session.commit()
             print("✅ Database migration completed successfully!")
@@ -53,6 +111,8 @@ def migrate_database():
             print("- Animal profiles management (dogs, cats, birds, etc.)")
             print("- Animal selection in bookings")
             print("- Enhanced admin booking view")
+            print("- Live admin booking feed")
+            print("- Booking archive (archive_bookings.py)")
 
         except Exception as e:
             db.session.rollback()
@@ -0,0 +1,214 @@
+from flask_sqlalchemy import SQLAlchemy
+from flask_login import LoginManager, UserMixin
+from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateIndex, CreateTable
+from datetime import datetime, timedelta
+import sqlite3
+
+# Extensions are bound to the app in create_app(), so importing the models is free of I/O
+db = SQLAlchemy()
+login_manager = LoginManager()
+login_manager.login_view = 'main.login'
+
+@event.listens_for(Engine, 'connect')
+def enable_sqlite_wal(dbapi_connection, connection_record):
+    # WAL lets readers such as backup_db.py hold a long snapshot without blocking writers
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        dbapi_connection.execute('PRAGMA journal_mode=WAL')
+
+class Sale(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    is_active = db.Column(db.Boolean, default=False)
+    discount_percentage = db.Column(db.Float, nullable=False)
+    color = db.Column(db.String(50), default='#2ecc71')
+
+class BookingFields:
+    # Columns shared by the live booking table and archived_booking
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    booking_name = db.Column(db.String(100), nullable=False)
+    phone_number = db.Column(db.String(20), nullable=False)
+    date = db.Column(db.Date, nullable=False)
+    start_time = db.Column(db.Time, nullable=False)
+    duration_hours = db.Column(db.Float, nullable=False)
+    total_cost = db.Column(db.Float, nullable=False)
+    sale_applied = db.Column(db.Integer, db.ForeignKey('sale.id'), nullable=True)
+    status = db.Column(db.String(20), default='pending', nullable=False)  # pending, approved, denied, in_progress, completed
+    admin_notes = db.Column(db.Text, nullable=True)
+    user_notes = db.Column(db.Text, nullable=True)
+    num_dogs = db.Column(db.Integer, nullable=True)
+    dog_breed = db.Column(db.String(100), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+class Booking(BookingFields, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    is_archived = False
+
+    # Archived bookings keep their id, so ids must never be handed out twice
+    __table_args__ = {'sqlite_autoincrement': True}
+
+    user = db.relationship('User', backref='bookings')
+    sale = db.relationship('Sale', backref='bookings')
+    selected_animals = db.relationship('BookingAnimal', backref='booking', lazy=True, cascade='all, delete-orphan')
+
+class ArchivedBooking(BookingFields, db.Model):
+    # Completed/denied bookings moved out of the hot booking table by archive_bookings.py.
+    # id is the original booking id.
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow)
+    is_archived = True
+
+    user = db.relationship('User')
+    sale = db.relationship('Sale')
+    selected_animals = db.relationship('ArchivedBookingAnimal', backref='booking', lazy=True, cascade='all, delete-orphan')
+
+    __table_args__ = (db.Index('ix_archived_booking_user_id', 'user_id'),)
+
+class User(UserMixin, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    username = db.Column(db.String(80), unique=True, nullable=False)
+    email = db.Column(db.String(120), unique=True, nullable=False)
+    phone_number = db.Column(db.String(20), unique=False, nullable=True)
+    password_hash = db.Column(db.String(120), nullable=False)
+    is_admin = db.Column(db.Boolean, default=False)
+    animals = db.relationship('Animal', backref='owner', lazy=True, cascade='all, delete-orphan')
+
+    def set_password(self, password):
+        self.password_hash = generate_password_hash(password)
+
+    def check_password(self, password):
+        return check_password_hash(self.password_hash, password)
+
+class Animal(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    name = db.Column(db.String(100), nullable=False)
+    animal_type = db.Column(db.String(50), nullable=False)  # dog, cat, bird, rabbit, etc.
+    breed = db.Column(db.String(100), nullable=False)
+    age = db.Column(db.Integer, nullable=True)
+    weight = db.Column(db.Float, nullable=True)  # in pounds
+    special_needs = db.Column(db.Text, nullable=True)
+    temperament = db.Column(db.String(50), nullable=True)  # friendly, shy, energetic, etc.
+    medical_conditions = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relationship to booking associations with cascade delete
+    booking_associations = db.relationship('BookingAnimal', backref='animal', lazy=True, cascade='all, delete-orphan')
+    archived_booking_associations = db.relationship('ArchivedBookingAnimal', backref='animal', lazy=True, cascade='all, delete-orphan')
+
+    @property
+    def all_booking_associations(self):
+        # Live and archived bookings alike; both expose .booking
+        return self.booking_associations + self.archived_booking_associations
+
+class BookingAnimal(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    booking_id = db.Column(db.Integer, db.ForeignKey('booking.id'), nullable=False)
+    animal_id = db.Column(db.Integer, db.ForeignKey('animal.id'), nullable=False)
+
+class ArchivedBookingAnimal(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    booking_id = db.Column(db.Integer, db.ForeignKey('archived_booking.id'), nullable=False, index=True)
+    animal_id = db.Column(db.Integer, db.ForeignKey('animal.id'), nullable=False)
+
+class BookingEvent(db.Model):
+    # Append-only change log tailed by the admin booking feed.
+    # booking_id is not a foreign key so 'deleted' events outlive their booking.
+    id = db.Column(db.Integer, primary_key=True)
+    booking_id = db.Column(db.Integer, nullable=False)
+    kind = db.Column(db.String(20), nullable=False)  # created, status, deleted, archived
+    status = db.Column(db.String(20), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+    # Never reuse ids once retention pruning empties the table; the feed's cursor only moves forward
+    __table_args__ = {'sqlite_autoincrement': True}
+
+    def to_payload(self):
+        return {'event_id': self.id, 'booking_id': self.booking_id, 'kind': self.kind, 'status': self.status}
+
+class Ban(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    email = db.Column(db.String(120), nullable=True)
+    phone_number = db.Column(db.String(20), nullable=True)
+    ip_address = db.Column(db.String(45), nullable=True)
+    reason = db.Column(db.String(255), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+@login_manager.user_loader
+def load_user(user_id):
+    return db.session.get(User, int(user_id))
+
+# Helper to check if banned
+def is_banned(email=None, phone=None, ip=None):
+    ban_query = Ban.query
+    if email:
+        ban_query = ban_query.filter_by(email=email)
+    if phone:
+        ban_query = ban_query.filter_by(phone_number=phone)
+    if ip:
+        ban_query = ban_query.filter_by(ip_address=ip)
+    return ban_query.first() is not None
+
+# Helper to list live and archived bookings together, ordered like the booking pages
+def booking_history(user_id=None, include_archived=True):
+    queries = [Booking.query]
+    if include_archived:
+        queries.append(ArchivedBooking.query)
+    bookings = []
+    for query in queries:
+        if user_id is not None:
+            query = query.filter_by(user_id=user_id)
+        bookings.extend(query.all())
+    bookings.sort(key=lambda booking: (booking.date, booking.start_time))
+    return bookings
+
+# Helper to append to the booking change log; committed together with the caller's change
+def record_booking_event(booking, kind):
+    db.session.add(BookingEvent(booking_id=booking.id, kind=kind, status=booking.status))
+
+# Helper to drop change log entries older than the retention window; returns how many went
+def prune_booking_events(retention_days):
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    pruned = BookingEvent.query.filter(BookingEvent.created_at < cutoff).delete()
+    db.session.commit()
+    return pruned
+
+def has_autoincrement(model):
+    """False only for an existing SQLite table created without AUTOINCREMENT"""
+    if db.engine.dialect.name != 'sqlite':
+        return True
+    create_sql = db.session.execute(text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                                    {'name': model.__table__.name}).scalar()
+    return create_sql is None or 'AUTOINCREMENT' in create_sql.upper()
+
+def rebuild_with_autoincrement(model, min_next_id=0):
+    """Recreate model's table with AUTOINCREMENT so SQLite never hands out ids of deleted rows again"""
+    table = model.__table__
+    if db.engine.dialect.name != 'sqlite' or has_autoincrement(model):
+        return False
+
+    rebuilt = table.to_metadata(db.metadata, name=f'{table.name}_rebuilt')
+    try:
+        columns = ', '.join(f'"{column.name}"' for column in table.columns)
+        db.session.execute(CreateTable(rebuilt))
+        db.session.execute(text(f'INSERT INTO {rebuilt.name} ({columns}) SELECT {columns} FROM {table.name}'))
+        db.session.execute(text(f'DROP TABLE {table.name}'))
+        db.session.execute(text(f'ALTER TABLE {rebuilt.name} RENAME TO {table.name}'))
+        for index in table.indexes:
+            db.session.execute(CreateIndex(index))
+    finally:
+        db.metadata.remove(rebuilt)
+
+    # Start new ids above any id that was ever handed out, not just the ones still in the table
+    current = db.session.execute(text("SELECT seq FROM sqlite_sequence WHERE name = :name"),
+                                 {'name': table.name}).scalar()
+    if current is None:
+        db.session.execute(text("INSERT INTO sqlite_sequence (name, seq) VALUES (:name, :seq)"),
+                           {'name': table.name, 'seq': min_next_id})
+    elif current < min_next_id:
+        db.session.execute(text("UPDATE sqlite_sequence SET seq = :seq WHERE name = :name"),
+                           {'name': table.name, 'seq': min_next_id})
+    return True
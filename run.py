@@ -4,13 +4,18 @@ Simple run script for the pet sitting website
 """
 
 import os
-from app import app
+from app import create_app, bootstrap_database
+
+app = create_app()
 
 if __name__ == '__main__':
     print("🚀 Starting Pet Sitting Website...")
     print("📍 Access at: http://localhost:5000")
     print("🛑 Press Ctrl+C to stop")
 
+    with app.app_context():
+        bootstrap_database()
+
     app.run(
         host='0.0.0.0',
         port=5000,